@@ -7,16 +7,16 @@ TEMPLATE_ID=9002
 STORAGE_NAME="local-zfs"
 
 
-[ -e $DISK_IMAGE ] && rm $DISK_IMAGE
+rm -f $DISK_IMAGE
 qm destroy $TEMPLATE_ID
 
-wget $IMAGE_URL
+wget $IMAGE_URL || exit 1
 
 
 #########################################################
 # Image specific 
 
-virt-customize -a $DISK_IMAGE --install qemu-guest-agent --update
+bash customize.sh -a $DISK_IMAGE --install qemu-guest-agent --update || exit 1
 
 
 
@@ -7,10 +7,10 @@ TEMPLATE_ID=9004
 STORAGE_NAME="local-zfs"
 
 
-[ -e $DISK_IMAGE ] && rm $DISK_IMAGE
+rm -f $DISK_IMAGE
 qm destroy $TEMPLATE_ID
 
-wget $IMAGE_URL
+wget $IMAGE_URL || exit 1
 
 
 #########################################################
@@ -19,7 +19,7 @@ wget $IMAGE_URL
 # Customize image and install qemu-guest-agent
 
 
-virt-customize -a $DISK_IMAGE --run-command "pacman-key --init" --install archlinux-keyring --install qemu-guest-agent --install resolvconf --update
+bash customize.sh -a $DISK_IMAGE --run-command "pacman-key --init" --install archlinux-keyring --install qemu-guest-agent --install resolvconf --update || exit 1
 
 
 
@@ -0,0 +1,18 @@
+#!/bin/bash
+
+# Runs virt-customize with the given arguments while holding one of
+# CUSTOMIZE_SLOTS lock slots. Every run boots a libguestfs appliance VM, so when
+# main.sh builds several templates in parallel only a few of them customize at once.
+
+CUSTOMIZE_SLOTS=2
+
+
+while true; do
+    for SLOT in $(seq 1 $CUSTOMIZE_SLOTS); do
+        exec 9> /run/lock/cloudbuilder-customize-$SLOT.lock
+        flock -n 9 && break 2
+    done
+    sleep 5
+done
+
+virt-customize "$@"
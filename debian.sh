@@ -7,10 +7,10 @@ TEMPLATE_ID=9000
 STORAGE_NAME="local-zfs"
 
 
-[ -e $DISK_IMAGE ] && rm $DISK_IMAGE
+rm -f $DISK_IMAGE
 qm destroy $TEMPLATE_ID
 
-wget $IMAGE_URL
+wget $IMAGE_URL || exit 1
 
 
 #########################################################
@@ -23,7 +23,7 @@ wget $IMAGE_URL
 # /run/network/interfaces.d/ens18 file
 
 
-virt-customize -a $DISK_IMAGE --install qemu-guest-agent --install resolvconf --update --run-command 'echo "auto ens18" >> /etc/network/interfaces.d/ens18' --run-command 'echo "iface ens18 inet manual" >> /etc/network/interfaces.d/ens18'
+bash customize.sh -a $DISK_IMAGE --install qemu-guest-agent --install resolvconf --update --run-command 'printf "auto ens18\niface ens18 inet manual\n" >> /etc/network/interfaces.d/ens18' || exit 1
 
 
 
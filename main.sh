@@ -3,15 +3,36 @@
 echo "This script will build Proxmox VE OS templates for Debian, Ubuntu and Alma"
 read -p "Press Enter to continue, or Ctrl+C to cancel."
 
-apt update && apt install -y libguestfs-tools
+command -v virt-customize > /dev/null || (apt update && apt install -y libguestfs-tools)
 
 
-# bash debian.sh
+# Each build uses its own image file and template ID, so they can run concurrently.
+# Every build gets its own process group (so Ctrl+C can stop it together with its
+# wget/virt-customize/qm children) and its own log file.
+PIDS=""
 
-# bash ubuntu-22-04.sh
+build() {
+    echo "Building $1, logging to $1.log"
+    setsid bash $1.sh < /dev/null > $1.log 2>&1 &
+    PIDS="$PIDS $!"
+}
 
-# bash ubuntu-22-10.sh
+trap 'for PID in $PIDS; do kill -- -$PID 2> /dev/null; done; exit 130' INT TERM
 
-# bash alma.sh
 
-bash arch.sh
\ No newline at end of file
+# build debian
+
+# build ubuntu-22-04
+
+# build ubuntu-22-10
+
+# build alma
+
+build arch
+
+
+RC=0
+for PID in $PIDS; do
+    wait $PID || RC=1
+done
+exit $RC
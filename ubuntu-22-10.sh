@@ -7,15 +7,15 @@ TEMPLATE_ID=9001
 STORAGE_NAME="local-zfs"
 
 
-[ -e $DISK_IMAGE ] && rm $DISK_IMAGE
+rm -f $DISK_IMAGE
 qm destroy $TEMPLATE_ID
 
-wget $IMAGE_URL
+wget $IMAGE_URL || exit 1
 
 #########################################################
 # Image specific 
 
-virt-customize -a $DISK_IMAGE --install qemu-guest-agent --install resolvconf --update --run-command 'systemctl enable qemu-guest-agent' --run-command 'systemctl restart qemu-guest-agent'
+bash customize.sh -a $DISK_IMAGE --install qemu-guest-agent --install resolvconf --update --run-command 'systemctl enable qemu-guest-agent' || exit 1
 
 
 